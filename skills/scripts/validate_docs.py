@@ -12,14 +12,27 @@ Usage:
     python skills/scripts/validate_docs.py                 # Validate all docs
     python skills/scripts/validate_docs.py path/to/doc.md  # Validate specific file
     python skills/scripts/validate_docs.py --fix           # Auto-fix issues where possible
+    python skills/scripts/validate_docs.py --cache         # Reuse results for unchanged files
 """
 
+import hashlib
+import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Tuple, Set
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Tuple, Set
+
+# google-re2 gives linear-time matching for the code reference pattern, which
+# runs on arbitrary doc content; the stdlib engine is the fallback
+try:
+    import re2 as _linear_re
+except ImportError:
+    _linear_re = re
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -30,190 +43,451 @@ class Colors:
     ENDC = '\033[0m'
     BOLD = '\033[1m'
 
-class DocValidator:
-    def __init__(self, project_root: Path, fix_mode: bool = False):
-        self.project_root = project_root
-        self.fix_mode = fix_mode
-        self.errors: List[str] = []
-        self.warnings: List[str] = []
-        self.fixes_applied: List[str] = []
-
-    def validate_file(self, doc_path: Path) -> Tuple[bool, List[str], List[str]]:
-        """Validate a single documentation file"""
-        print(f"\n{Colors.BLUE}Validating: {doc_path.relative_to(self.project_root)}{Colors.ENDC}")
-
-        self.errors = []
-        self.warnings = []
-        self.fixes_applied = []
-
-        if not doc_path.exists():
-            self.errors.append(f"File does not exist: {doc_path}")
-            return False, self.errors, self.warnings
-
-        content = doc_path.read_text(encoding='utf-8')
-
-        # Run all validation checks
-        self._check_broken_links(doc_path, content)
-        self._check_code_file_references(doc_path, content)
-        self._check_last_updated(doc_path, content)
-        self._check_required_sections(doc_path, content)
-        self._check_todo_markers(content)
-
-        # Print results
-        if self.errors:
-            print(f"  {Colors.RED}✗ {len(self.errors)} error(s){Colors.ENDC}")
-            for error in self.errors:
-                print(f"    {Colors.RED}• {error}{Colors.ENDC}")
+    @classmethod
+    def disable(cls):
+        """Drop escape codes, e.g. when output is redirected to a CI log"""
+        cls.GREEN = cls.YELLOW = cls.RED = cls.BLUE = cls.ENDC = cls.BOLD = ''
+
+# Directories never indexed or searched for docs
+EXCLUDED_DIRS = frozenset({'node_modules', '.next', '.git'})
+# Top-level directories searched for docs, besides the project root itself
+DOC_DIRS = frozenset({'docs', 'skills'})
+
+# Patterns are compiled once at import time rather than once per file
+_TODO_TAGS = ('TODO', 'FIXME', 'XXX', 'HACK')
+_TODO_RE = re.compile(r'(TODO|FIXME|XXX|HACK):\s*(.+)')
+_LAST_UPDATED_RE = re.compile(r'(?:\*\*Last Updated\*\*|Last Updated|Updated):\s*(\d{4}-\d{2}-\d{2})')
+# Code file references, matched against the text of an inline code span:
+# `file_path:line_number` (group 1) or a bare `src/...` / `app/...` source file (group 2)
+_FILE_REF_RE = _linear_re.compile(
+    r'([^`]+\.(?:ts|tsx|js|jsx|py|sql|md)):\d+'
+    r'|((?:src|app)/[^`]+\.(?:ts|tsx|js|jsx))'
+)
+# Example placeholders in code references, e.g. `src/your-feature.ts`
+_PLACEHOLDER_RE = re.compile(r'example|your-|xxx|\.\.\.', re.IGNORECASE)
+# Maximal runs of backticks, which open and close code spans
+_BACKTICK_RUN_RE = re.compile(r'`+')
+# Link targets that are never checked against the filesystem
+_EXTERNAL_PREFIXES = ('http://', 'https://', 'mailto:', '#')
+
+# Per-file results cache used with --cache, stored in the project root
+CACHE_FILE = '.validate_docs_cache.json'
+CACHE_VERSION = 1
+
+# Documents whose Last Updated stamp is older than this are flagged (6 months)
+STALE_AFTER_DAYS = 180
+
+# Required sections per document type
+_REQUIRED_SECTIONS = {
+    'runbook': ['Overview', 'Common Issues', 'Monitoring'],
+    'adr': ['Context', 'Decision', 'Consequences'],
+    'api': ['Overview', 'Endpoints', 'Error Handling'],
+}
+# One regex per doc type matching heading text against any required section
+_DOC_TYPE_REGEXES = {
+    doc_type: re.compile('(' + '|'.join(sections) + ')', re.IGNORECASE)
+    for doc_type, sections in _REQUIRED_SECTIONS.items()
+}
+
+@lru_cache(maxsize=None)
+def _path_exists(path_str: str) -> bool:
+    """Existence check memoized for the whole run, for paths outside the project index"""
+    return os.path.exists(path_str)
+
+def build_project_index(project_root: Path) -> Set[str]:
+    """Collect every file and directory in the project as a '/'-separated relative path"""
+    project_index: Set[str] = set()
+
+    for dirpath, dirs, filenames in os.walk(project_root):
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        rel_dir = os.path.relpath(dirpath, project_root)
+        prefix = '' if rel_dir == '.' else rel_dir.replace('\\', '/') + '/'
+        project_index.update(prefix + name for name in dirs)
+        project_index.update(prefix + name for name in filenames)
+
+    return project_index
+
+def _iter_links(content: str) -> Iterator[Tuple[str, str]]:
+    """Yield internal [text](link) links; external targets are skipped before slicing.
+
+    Like a regex findall, a complete [text](link) match - external or not -
+    consumes its span, so brackets inside an external URL are not links.
+    """
+    find = content.find
+    pos = find('[')
+
+    while pos != -1:
+        close = find(']', pos + 1)
+        if close == -1:
+            return
 
-        if self.warnings:
-            print(f"  {Colors.YELLOW}⚠ {len(self.warnings)} warning(s){Colors.ENDC}")
-            for warning in self.warnings:
-                print(f"    {Colors.YELLOW}• {warning}{Colors.ENDC}")
+        paren = close + 2
+        end = find(')', paren)
+        if end == -1:
+            return
 
-        if self.fixes_applied:
-            print(f"  {Colors.GREEN}✓ {len(self.fixes_applied)} fix(es) applied{Colors.ENDC}")
-            for fix in self.fixes_applied:
-                print(f"    {Colors.GREEN}• {fix}{Colors.ENDC}")
+        if close > pos + 1 and end > paren and content.startswith('(', close + 1):
+            if not content.startswith(_EXTERNAL_PREFIXES, paren):
+                yield content[pos + 1:close], content[paren:end]
+            pos = find('[', end + 1)
+        else:
+            pos = find('[', pos + 1)
+
+def _iter_code_spans(content: str) -> Iterator[str]:
+    """Yield the text of code spans and fenced blocks.
+
+    As in CommonMark, a run of backticks is closed by the next run of the
+    same length, so ``` fences don't throw off the pairing of later spans.
+    Every run is found once up front and looked at O(1) times, keeping the
+    scan linear even on adversarial input.
+    """
+    runs = [(m.start(), m.end()) for m in _BACKTICK_RUN_RE.finditer(content)]
+
+    # Run indices grouped by length, with a cursor per length that only moves forward
+    by_length: Dict[int, List[int]] = {}
+    for index, (start, end) in enumerate(runs):
+        by_length.setdefault(end - start, []).append(index)
+    cursors = dict.fromkeys(by_length, 0)
+
+    resume = 0
+    for index, (start, end) in enumerate(runs):
+        if start < resume:
+            continue
+
+        # Next run of the same length after this one closes the span;
+        # without one, the run is literal text
+        length = end - start
+        same = by_length[length]
+        cursor = cursors[length]
+        while cursor < len(same) and same[cursor] <= index:
+            cursor += 1
+        cursors[length] = cursor
+        if cursor == len(same):
+            continue
+
+        close_start, close_end = runs[same[cursor]]
+        if close_start > end:
+            yield content[end:close_start]
+        resume = close_end
+
+def _iter_headings(content: str) -> Iterator[Tuple[int, str]]:
+    """Yield ATX headings as (level, text)"""
+    find = content.find
+    # pos points at the newline before each heading; -1 stands in for the
+    # start of the document
+    pos = -1 if content.startswith('#') else find('\n#')
+
+    while pos != -1 or content.startswith('#'):
+        start = pos + 1
+        end = find('\n', start)
+        line = content[start:] if end == -1 else content[start:end]
+        text = line.lstrip('#')
+        # '#hashtag' is not a heading
+        if not text or text[0].isspace():
+            yield len(line) - len(text), text.strip()
+        if end == -1:
+            return
+        pos = find('\n#', end)
+        if pos == -1:
+            return
 
-        if not self.errors and not self.warnings:
-            print(f"  {Colors.GREEN}✓ All checks passed{Colors.ENDC}")
+def scan_content(content: str) -> Dict[str, list]:
+    """Collect links, code spans and headings, each from its own str.find walk.
 
-        return len(self.errors) == 0, self.errors, self.warnings
+    The kinds are scanned independently so a code span inside link text is
+    still reported.
+    """
+    return {
+        'link': list(_iter_links(content)),
+        'code': list(_iter_code_spans(content)),
+        'heading': list(_iter_headings(content)),
+    }
 
-    def _check_broken_links(self, doc_path: Path, content: str):
+class DocValidator:
+    def __init__(
+        self,
+        project_root: Path,
+        fix_mode: bool = False,
+        project_index: Optional[Set[str]] = None,
+        now: Optional[datetime] = None,
+    ):
+        self.project_root = project_root
+        # String forms for the per-link hot paths, which avoid Path objects
+        self.root = os.path.abspath(project_root)
+        self.root_prefix = os.path.join(self.root, '')
+        self.fix_mode = fix_mode
+        self.today = (datetime.now() if now is None else now).date()
+        self.stale_cutoff = self.today - timedelta(days=STALE_AFTER_DAYS)
+        self.project_index = build_project_index(project_root) if project_index is None else project_index
+
+    def _target_exists(self, target: str) -> bool:
+        """Check a normalized absolute path against the project index instead of the filesystem"""
+        if target == self.root:
+            return True
+
+        # Paths outside the project or under excluded directories aren't indexed
+        if not target.startswith(self.root_prefix):
+            return _path_exists(target)
+        rel_path = target[len(self.root_prefix):].replace(os.sep, '/')
+        if not EXCLUDED_DIRS.isdisjoint(rel_path.split('/')):
+            return _path_exists(target)
+
+        return rel_path in self.project_index
+
+    def validate_file(self, doc_path: Path) -> Tuple[Path, List[str], List[str]]:
+        """Validate a single documentation file.
+
+        Does not touch validator state or print anything, so it is safe to run
+        in worker processes; returns (doc_path, errors, warnings).
+        """
+        errors: List[str] = []
+        warnings: List[str] = []
+
+        # Unbuffered binary read and a single decode; opening directly also
+        # replaces a separate exists() stat. Newlines are normalized as
+        # read_text() would, so CRLF docs don't leak '\r' into messages
+        try:
+            with open(doc_path, 'rb', buffering=0) as f:
+                content = f.read().decode('utf-8', errors='replace')
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        except FileNotFoundError:
+            errors.append(f"File does not exist: {doc_path}")
+            return doc_path, errors, warnings
+
+        found = scan_content(content)
+
+        # Run all validation checks; each yields (severity, message) pairs
+        for severity, message in chain(
+            self._check_broken_links(doc_path, found['link']),
+            self._check_code_file_references(doc_path, found['code']),
+            self._check_last_updated(doc_path, content),
+            self._check_required_sections(doc_path, found['heading']),
+            self._check_todo_markers(content),
+        ):
+            (errors if severity == 'error' else warnings).append(message)
+
+        return doc_path, errors, warnings
+
+    def _check_broken_links(self, doc_path: Path, links: List[Tuple[str, str]]) -> Iterator[Tuple[str, str]]:
         """Check for broken internal markdown links"""
-        # Find all markdown links: [text](link)
-        link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-        links = re.findall(link_pattern, content)
+        doc_parent = os.path.dirname(os.path.abspath(doc_path))
 
         for link_text, link_url in links:
-            # Skip external URLs
-            if link_url.startswith(('http://', 'https://', 'mailto:', '#')):
-                continue
-
-            # Resolve relative paths
+            # Resolve relative paths lexically; resolve() would lstat every component
             if link_url.startswith('/'):
-                target_path = self.project_root / link_url.lstrip('/')
+                target = os.path.normpath(os.path.join(self.root, link_url.lstrip('/')))
             else:
-                target_path = (doc_path.parent / link_url).resolve()
+                target = os.path.normpath(os.path.join(doc_parent, link_url))
 
             # Check if file exists
-            if not target_path.exists():
-                self.errors.append(
-                    f"Broken link: [{link_text}]({link_url}) -> {target_path.relative_to(self.project_root)} not found"
+            if not self._target_exists(target):
+                yield 'error', (
+                    f"Broken link: [{link_text}]({link_url}) -> {os.path.relpath(target, self.root)} not found"
                 )
 
-    def _check_code_file_references(self, doc_path: Path, content: str):
+    def _check_code_file_references(self, doc_path: Path, code_spans: List[str]) -> Iterator[Tuple[str, str]]:
         """Check that referenced code files exist"""
-        # Pattern: `file_path:line_number` or just `path/to/file.ts`
-        file_patterns = [
-            r'`([^`]+\.(ts|tsx|js|jsx|py|sql|md)):(\d+)`',  # With line numbers
-            r'`(src/[^`]+\.(ts|tsx|js|jsx))`',  # Source files
-            r'`(app/[^`]+\.(ts|tsx|js|jsx))`',  # App files
-        ]
-
-        for pattern in file_patterns:
-            matches = re.findall(pattern, content)
-            for match in matches:
-                file_ref = match[0] if isinstance(match, tuple) else match
-
-                # Handle Windows paths
-                file_ref = file_ref.replace('\\', '/')
-
-                # Skip if it's an example placeholder
-                if any(placeholder in file_ref.lower() for placeholder in ['example', 'your-', 'xxx', '...']):
-                    continue
-
-                target_path = self.project_root / file_ref
-                if not target_path.exists():
-                    self.warnings.append(
-                        f"Referenced file may not exist: {file_ref}"
-                    )
-
-    def _check_last_updated(self, doc_path: Path, content: str):
-        """Check if Last Updated timestamp is recent"""
-        # Find Last Updated patterns
-        patterns = [
-            r'\*\*Last Updated\*\*:\s*(\d{4}-\d{2}-\d{2})',
-            r'Last Updated:\s*(\d{4}-\d{2}-\d{2})',
-            r'Updated:\s*(\d{4}-\d{2}-\d{2})'
-        ]
+        for code in code_spans:
+            match = _FILE_REF_RE.fullmatch(code)
+            if not match:
+                continue
+
+            file_ref = match.group(1) or match.group(2)
 
+            # Handle Windows paths
+            file_ref = file_ref.replace('\\', '/')
+
+            # Skip if it's an example placeholder
+            if _PLACEHOLDER_RE.search(file_ref):
+                continue
+
+            target = os.path.normpath(os.path.join(self.root, file_ref))
+            if not self._target_exists(target):
+                yield 'warning', f"Referenced file may not exist: {file_ref}"
+
+    def _check_last_updated(self, doc_path: Path, content: str) -> Iterator[Tuple[str, str]]:
+        """Check if Last Updated timestamp is recent"""
         last_updated = None
-        for pattern in patterns:
-            match = re.search(pattern, content)
-            if match:
-                last_updated = datetime.strptime(match.group(1), '%Y-%m-%d')
-                break
+        # Substring test first: most docs without a stamp skip the regex scan
+        match = _LAST_UPDATED_RE.search(content) if 'Updated' in content else None
+        if match:
+            # Fixed YYYY-MM-DD format; slicing avoids strptime's format parsing
+            stamp = match.group(1)
+            last_updated = date(int(stamp[0:4]), int(stamp[5:7]), int(stamp[8:10]))
 
         if last_updated:
-            days_old = (datetime.now() - last_updated).days
-            if days_old > 180:  # 6 months
-                self.warnings.append(
-                    f"Document hasn't been updated in {days_old} days (since {last_updated.strftime('%Y-%m-%d')})"
+            # Compare against the precomputed cutoff; only count days for the message
+            if last_updated < self.stale_cutoff:
+                days_old = (self.today - last_updated).days
+                yield 'warning', (
+                    f"Document hasn't been updated in {days_old} days (since {last_updated.isoformat()})"
                 )
         else:
             # Check if it's a template or example file
             if 'template' not in doc_path.name.lower():
-                self.warnings.append("No 'Last Updated' timestamp found")
+                yield 'warning', "No 'Last Updated' timestamp found"
 
-    def _check_required_sections(self, doc_path: Path, content: str):
+    def _check_required_sections(self, doc_path: Path, headings: List[Tuple[int, str]]) -> Iterator[Tuple[str, str]]:
         """Check for required sections based on document type"""
+        name = doc_path.name
+        lower_name = name.lower()
+
         # Skip templates
-        if 'template' in doc_path.name.lower():
+        if 'template' in lower_name:
             return
 
-        # Determine document type and required sections
-        required_sections = []
+        # Determine document type
+        doc_type = None
+
+        if 'runbook' in lower_name or 'RUNBOOK' in name:
+            doc_type = 'runbook'
+        elif 'adr' in lower_name or name.startswith('ADR'):
+            doc_type = 'adr'
+        elif 'api' in lower_name or 'API' in name:
+            doc_type = 'api'
 
-        if 'runbook' in doc_path.name.lower() or 'RUNBOOK' in doc_path.name:
-            required_sections = ['Overview', 'Common Issues', 'Monitoring']
-        elif 'adr' in doc_path.name.lower() or doc_path.name.startswith('ADR'):
-            required_sections = ['Context', 'Decision', 'Consequences']
-        elif 'api' in doc_path.name.lower() or 'API' in doc_path.name:
-            required_sections = ['Overview', 'Endpoints', 'Error Handling']
+        if doc_type is None:
+            return
+
+        # Collect the required sections present among the markdown headings
+        pattern = _DOC_TYPE_REGEXES[doc_type]
+        found = set()
+        for _, heading in headings:
+            match = pattern.match(heading)
+            if match:
+                found.add(match.group(1).lower())
 
-        # Check for each required section
-        for section in required_sections:
-            # Look for markdown headings with this section name
-            pattern = rf'^#+\s+{section}'
-            if not re.search(pattern, content, re.MULTILINE | re.IGNORECASE):
-                self.errors.append(f"Missing required section: {section}")
+        for section in _REQUIRED_SECTIONS[doc_type]:
+            if section.lower() not in found:
+                yield 'error', f"Missing required section: {section}"
 
-    def _check_todo_markers(self, content: str):
+    def _check_todo_markers(self, content: str) -> Iterator[Tuple[str, str]]:
         """Check for TODO/FIXME markers in documentation"""
-        todo_pattern = r'(TODO|FIXME|XXX|HACK):\s*(.+)'
-        todos = re.findall(todo_pattern, content)
+        if not any(tag in content for tag in _TODO_TAGS):
+            return
 
-        if todos:
-            for marker, description in todos:
-                self.warnings.append(
-                    f"Found {marker}: {description[:50]}..."
-                )
+        for marker, description in _TODO_RE.findall(content):
+            yield 'warning', f"Found {marker}: {description[:50]}..."
+
+# Per-process validator, set up once by _init_worker in each pool worker
+_worker_validator = None
+
+def _init_worker(project_root: Path, fix_mode: bool, project_index: Set[str], now: datetime):
+    """Pool initializer: build the validator once per worker process"""
+    global _worker_validator
+    _worker_validator = DocValidator(project_root, fix_mode, project_index, now)
+
+def _validate_worker(doc_path: Path) -> Tuple[Path, List[str], List[str]]:
+    """Validate one file inside a pool worker"""
+    return _worker_validator.validate_file(doc_path)
+
+def print_result(project_root: Path, doc_path: Path, errors: List[str], warnings: List[str]):
+    """Print the validation results for a single file in one write"""
+    lines = [f"\n{Colors.BLUE}Validating: {doc_path.relative_to(project_root)}{Colors.ENDC}"]
+
+    if errors:
+        lines.append(f"  {Colors.RED}✗ {len(errors)} error(s){Colors.ENDC}")
+        lines.extend(f"    {Colors.RED}• {error}{Colors.ENDC}" for error in errors)
+
+    if warnings:
+        lines.append(f"  {Colors.YELLOW}⚠ {len(warnings)} warning(s){Colors.ENDC}")
+        lines.extend(f"    {Colors.YELLOW}• {warning}{Colors.ENDC}" for warning in warnings)
+
+    if not errors and not warnings:
+        lines.append(f"  {Colors.GREEN}✓ All checks passed{Colors.ENDC}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+def cache_fingerprint(project_index: Set[str], now: datetime) -> str:
+    """Identify everything besides a file's own content that its results depend on.
+
+    Link checks depend on which project files exist and staleness on today's
+    date, so cached results are only reused when both are unchanged.
+    """
+    digest = hashlib.sha1(f"{CACHE_VERSION}:{STALE_AFTER_DAYS}:{now.date().isoformat()}".encode())
+    for rel_path in sorted(project_index):
+        if rel_path != CACHE_FILE:
+            digest.update(rel_path.encode('utf-8', errors='surrogateescape') + b'\0')
+    return digest.hexdigest()
+
+def load_cache(cache_path: Path, fingerprint: str) -> Dict[str, dict]:
+    """Load cached per-file results, or nothing if missing, unreadable or stale"""
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get('fingerprint') != fingerprint:
+        return {}
+    files = data.get('files')
+    return files if isinstance(files, dict) else {}
+
+def save_cache(cache_path: Path, fingerprint: str, files: Dict[str, dict]):
+    """Write the cache atomically so an interrupted run never leaves it truncated"""
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': fingerprint, 'files': files}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Don't leave a partial temp file behind
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _file_size(path: Path) -> int:
+    """Size in bytes for scheduling; missing files sort last"""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+def _pool_size(file_count: int) -> int:
+    """Workers to start: no more than there are files or CPUs.
+
+    Pools start all their workers up front, and Windows rejects an explicit
+    max_workers above 61.
+    """
+    workers = min(os.cpu_count() or 1, file_count)
+    if sys.platform == 'win32':
+        workers = min(workers, 61)
+    return workers
+
+def validate_files(
+    doc_files: List[Path], project_root: Path, fix_mode: bool, project_index: Set[str], now: datetime
+) -> List[Tuple[Path, List[str], List[str]]]:
+    """Validate files in parallel, returning results in input order"""
+    if len(doc_files) > 1:
+        # Largest files first, one at a time, so a big doc doesn't start last
+        # and leave the other workers idle
+        by_size = sorted(doc_files, key=_file_size, reverse=True)
+        with ProcessPoolExecutor(
+            max_workers=_pool_size(len(doc_files)),
+            initializer=_init_worker,
+            initargs=(project_root, fix_mode, project_index, now),
+        ) as executor:
+            results = {result[0]: result for result in executor.map(_validate_worker, by_size, chunksize=1)}
+        return [results[doc_file] for doc_file in doc_files]
+
+    validator = DocValidator(project_root, fix_mode, project_index, now)
+    return [validator.validate_file(doc_file) for doc_file in doc_files]
 
 def find_all_docs(project_root: Path) -> List[Path]:
     """Find all markdown files in the project"""
-    docs_dir = project_root / 'docs'
-    skills_dir = project_root / 'skills'
-
+    root = os.fspath(project_root)
     doc_files = []
 
-    # Search in docs/ directory
-    if docs_dir.exists():
-        doc_files.extend(docs_dir.glob('**/*.md'))
-
-    # Search in skills/ directory
-    if skills_dir.exists():
-        doc_files.extend(skills_dir.glob('**/*.md'))
-
-    # Include root-level markdown files
-    doc_files.extend(project_root.glob('*.md'))
-
-    # Exclude node_modules and .next
-    doc_files = [
-        f for f in doc_files
-        if 'node_modules' not in str(f) and '.next' not in str(f)
-    ]
+    # One walk: root-level files plus docs/ and skills/, pruning excluded
+    # directories before they are descended into
+    for dirpath, dirs, filenames in os.walk(root):
+        if dirpath == root:
+            dirs[:] = [d for d in dirs if d in DOC_DIRS]
+        else:
+            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        doc_files.extend(Path(dirpath, f) for f in filenames if f.endswith('.md'))
 
     return sorted(doc_files)
 
@@ -223,11 +497,15 @@ def main():
     script_path = Path(__file__).resolve()
     project_root = script_path.parent.parent.parent
 
+    if not sys.stdout.isatty():
+        Colors.disable()
+
     print(f"{Colors.BOLD}Documentation Validator{Colors.ENDC}")
     print(f"Project root: {project_root}\n")
 
     # Parse arguments
     fix_mode = '--fix' in sys.argv
+    use_cache = '--cache' in sys.argv
     specific_file = None
 
     for arg in sys.argv[1:]:
@@ -246,18 +524,58 @@ def main():
     if fix_mode:
         print(f"{Colors.YELLOW}Fix mode enabled - will attempt to auto-fix issues{Colors.ENDC}")
 
-    # Validate each file
-    validator = DocValidator(project_root, fix_mode)
+    # Index the project once so link checks are set lookups, not stat calls
+    project_index = build_project_index(project_root)
+    now = datetime.now()
+
+    # With --cache, files whose (mtime, size) match the cache skip validation
+    cached_results = {}
+    cache_entries: Dict[str, dict] = {}
+    file_stats: Dict[str, dict] = {}
+    if use_cache:
+        cache_path = project_root / CACHE_FILE
+        fingerprint = cache_fingerprint(project_index, now)
+        cached = load_cache(cache_path, fingerprint)
+        # Only a full run knows which docs are gone; a single-file run keeps
+        # the other entries
+        if specific_file:
+            cache_entries.update(cached)
+
+        for doc_file in doc_files:
+            try:
+                st = doc_file.stat()
+            except OSError:
+                continue
+            rel_path = os.path.relpath(doc_file, project_root).replace('\\', '/')
+            # Malformed entries (e.g. a hand-edited cache) are simply revalidated
+            entry = cached.get(rel_path)
+            if (
+                isinstance(entry, dict)
+                and entry.get('mtime') == st.st_mtime_ns
+                and entry.get('size') == st.st_size
+                and isinstance(entry.get('errors'), list)
+                and isinstance(entry.get('warnings'), list)
+            ):
+                cached_results[doc_file] = (doc_file, entry['errors'], entry['warnings'])
+            file_stats[rel_path] = {'mtime': st.st_mtime_ns, 'size': st.st_size}
+
+    pending = [doc_file for doc_file in doc_files if doc_file not in cached_results]
+    fresh_results = validate_files(pending, project_root, fix_mode, project_index, now)
+    results_by_file = dict(cached_results)
+    results_by_file.update((result[0], result) for result in fresh_results)
+    results = [results_by_file[doc_file] for doc_file in doc_files]
+
+    # Print after collection so worker output never interleaves
     total_errors = 0
     total_warnings = 0
     failed_files = []
 
-    for doc_file in doc_files:
-        success, errors, warnings = validator.validate_file(doc_file)
+    for doc_file, errors, warnings in results:
+        print_result(project_root, doc_file, errors, warnings)
         total_errors += len(errors)
         total_warnings += len(warnings)
 
-        if not success:
+        if errors:
             failed_files.append(doc_file)
 
     # Print summary
@@ -274,6 +592,19 @@ def main():
     if total_warnings > 0:
         print(f"  {Colors.YELLOW}Total warnings: {total_warnings}{Colors.ENDC}")
 
+    # The cache is optional: failing to write it never fails the run
+    if use_cache:
+        for doc_file, errors, warnings in results:
+            rel_path = os.path.relpath(doc_file, project_root).replace('\\', '/')
+            if rel_path in file_stats:
+                cache_entries[rel_path] = dict(file_stats[rel_path], errors=errors, warnings=warnings)
+        try:
+            save_cache(cache_path, fingerprint, cache_entries)
+        except OSError as e:
+            print(f"  {Colors.YELLOW}Could not write cache {cache_path}: {e}{Colors.ENDC}")
+
+    sys.stdout.flush()
+
     # Exit with appropriate code
     sys.exit(1 if failed_files else 0)
 